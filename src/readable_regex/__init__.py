@@ -1,5 +1,5 @@
-from readable_regex.builder import RegexBuilder
+from readable_regex.builder import RegexBuilder, _RegexRoot, precompile, purge
 
-regex = RegexBuilder()
+regex: RegexBuilder = _RegexRoot()
 
-__all__ = ["regex", "RegexBuilder"]
+__all__ = ["regex", "RegexBuilder", "precompile", "purge"]
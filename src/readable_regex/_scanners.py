@@ -0,0 +1,115 @@
+"""Optional Numba scanners for fixed-width digit patterns.
+
+Patterns built only from literal text and single or `exactly(n)` digits
+(e.g. `\\d{3}\\-\\d{3}\\-\\d{4}`) have a fixed width and never backtrack, so
+`find_all` over ASCII text reduces to a byte loop. When `numba` is installed
+that loop is JIT-compiled (install the ``jit`` extra); otherwise no scanner
+is built and `re` is used.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable, MutableSequence, Sequence
+from typing import Final
+
+from readable_regex.components import (
+    CharClass,
+    CharClassType,
+    Component,
+    Literal,
+    Quantifier,
+    QuantifierKind,
+)
+
+# Spec code for "any ASCII digit"; other codes are literal byte values.
+DIGIT: Final = -1
+
+# Below this many characters the JIT call overhead outweighs the faster loop.
+MIN_SCAN_LENGTH: Final = 256
+
+
+def scan_spec(components: Sequence[Component]) -> tuple[int, ...] | None:
+    """Return the per-position byte spec of a fixed-width digit pattern, or None."""
+    spec: list[int] = []
+    for c in components:
+        if isinstance(c, Literal):
+            if not c.text.isascii():
+                return None
+            spec.extend(c.text.encode("ascii"))
+        elif isinstance(c, CharClass) and c.class_type is CharClassType.DIGIT:
+            spec.append(DIGIT)
+        elif (
+            isinstance(c, Quantifier)
+            and c.kind is QuantifierKind.EXACT
+            and isinstance(c.target, CharClass)
+            and c.target.class_type is CharClassType.DIGIT
+            and c.count is not None
+        ):
+            spec.extend([DIGIT] * c.count)
+        else:
+            return None
+    if DIGIT not in spec:
+        return None
+    return tuple(spec)
+
+
+def scan(buf: Sequence[int], spec: Sequence[int], out: MutableSequence[int]) -> int:
+    """Write the start offsets of leftmost non-overlapping matches to `out`.
+
+    Returns the number of matches. Plain Python; JIT-compiled below when
+    Numba is available.
+    """
+    n = len(buf)
+    width = len(spec)
+    found = 0
+    i = 0
+    while i + width <= n:
+        j = 0
+        while j < width:
+            c = buf[i + j]
+            s = spec[j]
+            if s == DIGIT:
+                if c < 48 or c > 57:
+                    break
+            elif c != s:
+                break
+            j += 1
+        if j == width:
+            out[found] = i
+            found += 1
+            i += width
+        else:
+            i += 1
+    return found
+
+
+@functools.cache
+def _jit_scan() -> Callable[..., int] | None:
+    # Numba takes a few hundred milliseconds to import, so it is only loaded
+    # once a find_all call can actually use a scanner.
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - depends on the environment
+        return None
+    return numba.njit(cache=True)(scan)
+
+
+def make_scanner(spec: tuple[int, ...]) -> Callable[[str], list[str]] | None:
+    scan_jit = _jit_scan()
+    if scan_jit is None:
+        return None
+    import numpy as np
+
+    width = len(spec)
+    spec_arr = np.array(spec, dtype=np.int16)
+    # Compile (or load from cache) now rather than on the first real call.
+    scan_jit(np.zeros(0, dtype=np.uint8), spec_arr, np.zeros(1, dtype=np.int64))
+
+    def scanner(text: str) -> list[str]:
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        out = np.empty(len(buf) // width + 1, dtype=np.int64)
+        found = scan_jit(buf, spec_arr, out)
+        return [text[i : i + width] for i in out[:found].tolist()]
+
+    return scanner
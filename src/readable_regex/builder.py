@@ -1,115 +1,299 @@
 from __future__ import annotations
 
+import functools
 import re
-from typing import Sequence
+from typing import Any, Callable, Final, Iterator, Mapping, Sequence
+from typing import Literal as LiteralType
 
+from readable_regex._scanners import MIN_SCAN_LENGTH, make_scanner, scan_spec
 from readable_regex.compiler import compile_components
 from readable_regex.components import (
+    CHAR_CLASSES,
+    CHAR_CLASSES_PLUS,
     Anchor,
+    AnchoredLiteral,
     AnchorType,
     AnyOf,
     CharClass,
     CharClassType,
     Component,
-    ExcludeFilter,
     Group,
     Literal,
     Quantifier,
     QuantifierKind,
+    exclude_filter,
 )
 from readable_regex.exclude_proxy import ExcludeProxy
-from readable_regex.flags import Flag, flags_to_re
+from readable_regex.flags import Flag
+
+# Plain-int flag bits, so flag checks and ORs stay off the IntFlag operators.
+_IGNORE_CASE: Final = int(Flag.IGNORE_CASE)
+_MULTILINE: Final = int(Flag.MULTILINE)
+
+
+@functools.lru_cache(maxsize=2048)
+def _compile_cached(pattern: str, flags: int) -> re.Pattern[str]:
+    return re.compile(pattern, flags)
+
+
+def purge() -> None:
+    """Clear the process-wide compiled pattern cache (like `re.purge`)."""
+    _compile_cached.cache_clear()
+
+
+def precompile(patterns: Mapping[str, RegexBuilder]) -> dict[str, re.Pattern[str]]:
+    """Warm up named builders ahead of first use, e.g. at import time.
+
+    Returns the compiled `re.Pattern` for each name.
+    """
+    return {name: builder.prewarm().compile() for name, builder in patterns.items()}
+
+
+def _literal_test(
+    components: Sequence[Component], multiline: bool = False
+) -> Callable[[str], bool] | None:
+    """Lower a pattern of plain text (optionally ^/$ anchored) to str methods.
+
+    Returns a predicate equivalent to `re.search(pattern, text) is not None`,
+    or None when the pattern needs the regex engine.
+    """
+    items: list[Component] = []
+    for c in components:
+        if isinstance(c, AnchoredLiteral):
+            items.extend(c.split())
+        else:
+            items.append(c)
+    anchored_start = anchored_end = False
+    if items and isinstance(items[0], Anchor) and items[0].anchor_type is AnchorType.START:
+        anchored_start = True
+        items = items[1:]
+    if items and isinstance(items[-1], Anchor) and items[-1].anchor_type is AnchorType.END:
+        anchored_end = True
+        items = items[:-1]
+    texts = []
+    for c in items:
+        if not isinstance(c, Literal):
+            return None
+        texts.append(c.text)
+    if multiline and (anchored_start or anchored_end):
+        return None
+
+    literal = "".join(texts)
+    # Without MULTILINE, `$` also matches just before a trailing newline.
+    with_newline = literal + "\n"
+    if anchored_start and anchored_end:
+        return lambda text: text == literal or text == with_newline
+    if anchored_start:
+        return lambda text: text.startswith(literal)
+    if anchored_end:
+        endings = (literal, with_newline)
+        return lambda text: text.endswith(endings)
+    return lambda text: literal in text
+
+
+def _plain_text(components: Sequence[Component]) -> str:
+    """Text of a pattern made only of unanchored literals, else ""."""
+    texts = []
+    for c in components:
+        if not isinstance(c, Literal):
+            return ""
+        texts.append(c.text)
+    return "".join(texts)
+
+
+_QUANTIFIER_CHARS: Final = frozenset("?*+{")
+
+
+def _required_literal(components: Sequence[Component]) -> str:
+    """Longest literal text every match of the pattern must contain.
+
+    Only unquantified literals (including those inside capture groups)
+    count. Returns "" when there is none.
+    """
+    best = ""
+    for i, c in enumerate(components):
+        following = components[i + 1].compile() if i + 1 < len(components) else ""
+        if following[:1] in _QUANTIFIER_CHARS:
+            # A quantifier over empty text compiles to a bare `?`, `*`, ...
+            # that binds to this literal's last character.
+            continue
+        if isinstance(c, Literal):
+            text = c.text
+        elif isinstance(c, AnchoredLiteral):
+            text = c.literal.text
+        elif isinstance(c, Group):
+            text = _required_literal(c.content)
+        else:
+            continue
+        if len(text) > len(best):
+            best = text
+    return best
 
 
 class RegexBuilder:
+    __slots__ = (
+        "_compiled",
+        "_findall",
+        "_flags",
+        "_match",
+        "_matcher",
+        "_parent",
+        "_pattern",
+        "_scanner",
+        "_search",
+        "_split",
+        "_sub",
+        "_tail",
+    )
+
     def __init__(
         self,
         components: tuple[Component, ...] = (),
-        flags: frozenset[Flag] = frozenset(),
+        flags: int = 0,
+        parent: RegexBuilder | None = None,
     ) -> None:
-        self._components = components
+        # Builders form a persistent list: each one only stores the
+        # components it added on top of `parent`.
+        self._parent = parent
+        self._tail = components
         self._flags = flags
         self._compiled: re.Pattern[str] | None = None
+        self._pattern: str | None = None
+        self._matcher: Callable[[str], bool] | None = None
+        # Bound methods of the compiled pattern, filled in on first use.
+        self._search: Callable[[str], re.Match[str] | None] | None = None
+        self._match: Callable[[str], re.Match[str] | None] | None = None
+        self._findall: Callable[[str], list[Any]] | None = None
+        self._sub: Callable[[str, str], str] | None = None
+        self._split: Callable[[str], list[str]] | None = None
+        # None until find_all first needs it; False when no scanner applies.
+        self._scanner: Callable[[str], list[str]] | LiteralType[False] | None = None
+
+    # Builders are immutable, so two with the same pattern and flags are
+    # interchangeable; both values are cached after first use.
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RegexBuilder):
+            return NotImplemented
+        return self._flags == other._flags and self.pattern == other.pattern
+
+    def __hash__(self) -> int:
+        return hash((self.pattern, self._flags))
+
+    @property
+    def _components(self) -> tuple[Component, ...]:
+        if self._parent is None:
+            return self._tail
+        return tuple(self._iter_components())
+
+    def _iter_components(self) -> Iterator[Component]:
+        nodes: list[RegexBuilder] = []
+        node: RegexBuilder | None = self
+        while node is not None:
+            nodes.append(node)
+            node = node._parent
+        for node in reversed(nodes):
+            yield from node._tail
 
     def _extend(self, *new_components: Component) -> RegexBuilder:
-        return RegexBuilder(self._components + new_components, self._flags)
+        return RegexBuilder(new_components, self._flags, self)
+
+    def _with_flag(self, flag: int) -> RegexBuilder:
+        builder = RegexBuilder(self._tail, self._flags | flag, self._parent)
+        builder._pattern = self._pattern
+        return builder
+
+    def _last(self) -> Component | None:
+        if self._tail:
+            return self._tail[-1]
+        components = self._components
+        return components[-1] if components else None
 
-    def _with_flag(self, flag: Flag) -> RegexBuilder:
-        return RegexBuilder(self._components, self._flags | {flag})
+    def _replace_last(self, *components: Component) -> RegexBuilder:
+        if self._tail:
+            return RegexBuilder(self._tail[:-1] + components, self._flags, self._parent)
+        return RegexBuilder(self._components[:-1] + components, self._flags)
 
     def _quantify_last(self, kind: QuantifierKind, **kwargs: int | None) -> RegexBuilder:
-        if not self._components:
+        last = self._last()
+        if last is None:
             raise ValueError("No component to quantify")
-        last = self._components[-1]
-        quantified = Quantifier(last, kind, **kwargs)
-        return RegexBuilder(self._components[:-1] + (quantified,), self._flags)
+        if isinstance(last, Literal) and last.split_at:
+            # Only the text added by the last then() is quantified.
+            head = Literal(last.text[: last.split_at])
+            target = Literal(last.text[last.split_at :])
+            return self._replace_last(head, Quantifier(target, kind, **kwargs))
+        if isinstance(last, AnchoredLiteral):
+            # Quantify whichever part the unfused chain would have ended with.
+            return self._replace_last(*last.split())._quantify_last(kind, **kwargs)
+        return self._replace_last(Quantifier(last, kind, **kwargs))
 
     # ── Anchors & Literals ──────────────────────────────────────────
 
     def starts_with(self, text: str | None = None) -> RegexBuilder:
-        parts: list[Component] = [Anchor(AnchorType.START)]
-        if text is not None:
-            parts.append(Literal(text))
-        return self._extend(*parts)
+        if text is None:
+            return self._extend(Anchor(AnchorType.START))
+        return self._extend(AnchoredLiteral(AnchorType.START, Literal(text)))
 
     def ends_with(self, text: str | None = None) -> RegexBuilder:
-        parts: list[Component] = []
-        if text is not None:
-            parts.append(Literal(text))
-        parts.append(Anchor(AnchorType.END))
-        return self._extend(*parts)
+        if text is None:
+            return self._extend(Anchor(AnchorType.END))
+        return self._extend(AnchoredLiteral(AnchorType.END, Literal(text)))
 
     def then(self, text: str) -> RegexBuilder:
-        return self._extend(Literal(text))
+        tail = self._tail
+        if tail and type(tail[-1]) is Literal:
+            # Consecutive then() texts share one Literal; split_at records
+            # where this call's text starts so a quantifier only takes it.
+            prev = tail[-1]
+            merged = Literal(
+                prev.text + text, len(prev.text), prev.compile() + Literal(text).compile()
+            )
+            return RegexBuilder(tail[:-1] + (merged,), self._flags, self._parent)
+        return RegexBuilder((Literal(text),), self._flags, self)
 
     # ── Character Classes (singular = one) ──────────────────────────
 
     @property
     def digit(self) -> RegexBuilder:
-        return self._extend(CharClass(CharClassType.DIGIT))
+        return self._extend(CHAR_CLASSES[CharClassType.DIGIT])
 
     @property
     def word(self) -> RegexBuilder:
-        return self._extend(CharClass(CharClassType.WORD))
+        return self._extend(CHAR_CLASSES[CharClassType.WORD])
 
     @property
     def whitespace(self) -> RegexBuilder:
-        return self._extend(CharClass(CharClassType.WHITESPACE))
+        return self._extend(CHAR_CLASSES[CharClassType.WHITESPACE])
 
     @property
     def any_char(self) -> RegexBuilder:
-        return self._extend(CharClass(CharClassType.ANY))
+        return self._extend(CHAR_CLASSES[CharClassType.ANY])
 
     @property
     def letter(self) -> RegexBuilder:
-        return self._extend(CharClass(CharClassType.LETTER))
+        return self._extend(CHAR_CLASSES[CharClassType.LETTER])
 
     # ── Character Classes (plural = one or more) ────────────────────
 
     @property
     def digits(self) -> RegexBuilder:
-        cc = CharClass(CharClassType.DIGIT)
-        return self._extend(Quantifier(cc, QuantifierKind.ONE_OR_MORE))
+        return self._extend(CHAR_CLASSES_PLUS[CharClassType.DIGIT])
 
     @property
     def words(self) -> RegexBuilder:
-        cc = CharClass(CharClassType.WORD)
-        return self._extend(Quantifier(cc, QuantifierKind.ONE_OR_MORE))
+        return self._extend(CHAR_CLASSES_PLUS[CharClassType.WORD])
 
     @property
     def whitespaces(self) -> RegexBuilder:
-        cc = CharClass(CharClassType.WHITESPACE)
-        return self._extend(Quantifier(cc, QuantifierKind.ONE_OR_MORE))
+        return self._extend(CHAR_CLASSES_PLUS[CharClassType.WHITESPACE])
 
     @property
     def any_chars(self) -> RegexBuilder:
-        cc = CharClass(CharClassType.ANY)
-        return self._extend(Quantifier(cc, QuantifierKind.ONE_OR_MORE))
+        return self._extend(CHAR_CLASSES_PLUS[CharClassType.ANY])
 
     @property
     def letters(self) -> RegexBuilder:
-        cc = CharClass(CharClassType.LETTER)
-        return self._extend(Quantifier(cc, QuantifierKind.ONE_OR_MORE))
+        return self._extend(CHAR_CLASSES_PLUS[CharClassType.LETTER])
 
     # ── Combinators ─────────────────────────────────────────────────
 
@@ -117,7 +301,7 @@ class RegexBuilder:
         return self._extend(AnyOf(options))
 
     def capture(self, content: RegexBuilder) -> RegexBuilder:
-        return self._extend(Group(content._components))
+        return self._extend(Group(content._components, content.pattern))
 
     # ── Quantifiers (modify last component) ─────────────────────────
 
@@ -152,20 +336,19 @@ class RegexBuilder:
         """Filters characters from the last char class component.
         e.g., regex.words.excluding('_') → [^\\W_]+
         """
-        if not self._components:
+        last = self._last()
+        if last is None:
             raise ValueError("No component to filter")
 
-        last = self._components[-1]
-
         # If last is a quantified char class, unwrap, filter, re-wrap
         if isinstance(last, Quantifier) and isinstance(last.target, CharClass):
-            filtered = ExcludeFilter(last.target.class_type, chars)
+            filtered = exclude_filter(last.target.class_type, chars)
             new_last = Quantifier(filtered, last.kind, last.count, last.min_count, last.max_count)
-            return RegexBuilder(self._components[:-1] + (new_last,), self._flags)
+            return self._replace_last(new_last)
 
         if isinstance(last, CharClass):
-            filtered = ExcludeFilter(last.class_type, chars)
-            return RegexBuilder(self._components[:-1] + (filtered,), self._flags)
+            filtered = exclude_filter(last.class_type, chars)
+            return self._replace_last(filtered)
 
         raise ValueError("excluding() can only be applied to a character class")
 
@@ -173,37 +356,192 @@ class RegexBuilder:
 
     @property
     def ignore_case(self) -> RegexBuilder:
-        return self._with_flag(Flag.IGNORE_CASE)
+        return self._with_flag(_IGNORE_CASE)
 
     @property
     def multiline(self) -> RegexBuilder:
-        return self._with_flag(Flag.MULTILINE)
+        return self._with_flag(_MULTILINE)
 
     # ── Compilation & Execution ─────────────────────────────────────
 
     @property
     def pattern(self) -> str:
-        return compile_components(self._components)
+        if self._pattern is None:
+            # Walk up to the nearest ancestor with a cached pattern and only
+            # compile the components added since then.
+            nodes: list[RegexBuilder] = []
+            node: RegexBuilder | None = self
+            while node is not None and node._pattern is None:
+                nodes.append(node)
+                node = node._parent
+            prefix = (node._pattern or "") if node is not None else ""
+            suffix = [c for n in reversed(nodes) for c in n._tail]
+            self._pattern = prefix + compile_components(suffix)
+        return self._pattern
 
     def compile(self) -> re.Pattern[str]:
         if self._compiled is None:
-            self._compiled = re.compile(self.pattern, flags_to_re(self._flags))
+            self._compiled = _compile_cached(self.pattern, self._flags)
+            self._search = self._compiled.search
         return self._compiled
 
+    def prewarm(self) -> RegexBuilder:
+        """Compile now and prepare the fast path used by test()."""
+        self.compile()
+        if self._matcher is None:
+            self._matcher = self._build_matcher()
+        return self
+
     def search(self, text: str) -> re.Match[str] | None:
-        return self.compile().search(text)
+        search = self._search
+        if search is None:
+            search = self.compile().search
+        return search(text)
 
     def match(self, text: str) -> re.Match[str] | None:
-        return self.compile().match(text)
+        match = self._match
+        if match is None:
+            match = self._match = self.compile().match
+        return match(text)
+
+    def _build_scanner(self) -> Callable[[str], list[str]] | LiteralType[False]:
+        if not self._flags & _IGNORE_CASE:
+            spec = scan_spec(self._components)
+            if spec is not None:
+                return make_scanner(spec) or False
+        return False
+
+    def _plain_literal(self) -> str:
+        # Case folding needs the regex engine.
+        if self._flags & _IGNORE_CASE:
+            return ""
+        return _plain_text(self._components)
+
+    def _build_findall(self) -> Callable[[str], list[Any]]:
+        literal = self._plain_literal()
+        if literal:
+            return lambda text: [literal] * text.count(literal)
+        return self.compile().findall
 
     def find_all(self, text: str) -> list[str]:
-        return self.compile().findall(text)
+        if len(text) >= MIN_SCAN_LENGTH and text.isascii():
+            scanner = self._scanner
+            if scanner is None:
+                scanner = self._scanner = self._build_scanner()
+            if scanner:
+                return scanner(text)
+        findall = self._findall
+        if findall is None:
+            findall = self._findall = self._build_findall()
+        return findall(text)
+
+    def _build_sub(self) -> Callable[[str, str], str]:
+        literal = self._plain_literal()
+        if not literal:
+            return self.compile().sub
+        compile = self.compile
+
+        def sub(repl: str, text: str) -> str:
+            # A backslash in repl starts an escape or group reference.
+            if not isinstance(repl, str) or "\\" in repl:
+                return compile().sub(repl, text)
+            return text.replace(literal, repl)
+
+        return sub
 
     def replace(self, text: str, repl: str) -> str:
-        return self.compile().sub(repl, text)
+        sub = self._sub
+        if sub is None:
+            sub = self._sub = self._build_sub()
+        return sub(repl, text)
+
+    def _build_split(self) -> Callable[[str], list[str]]:
+        literal = self._plain_literal()
+        if literal:
+            return lambda text: text.split(literal)
+        return self.compile().split
 
     def split(self, text: str) -> list[str]:
-        return self.compile().split(text)
+        split = self._split
+        if split is None:
+            split = self._split = self._build_split()
+        return split(text)
+
+    def _build_matcher(self) -> Callable[[str], bool]:
+        required = ""
+        if not self._flags & _IGNORE_CASE:
+            components = self._components
+            matcher = _literal_test(components, bool(self._flags & _MULTILINE))
+            if matcher is not None:
+                return matcher
+            # Text that lacks a required literal cannot match; `in` rejects
+            # it without entering the regex engine.
+            required = _required_literal(components)
+        search = self.compile().search
+        if required:
+            return lambda text: required in text and search(text) is not None
+        return lambda text: search(text) is not None
 
     def test(self, text: str) -> bool:
-        return self.compile().search(text) is not None
+        matcher = self._matcher
+        if matcher is None:
+            matcher = self._matcher = self._build_matcher()
+        return matcher(text)
+
+
+class _RegexRoot(RegexBuilder):
+    """The empty builder exported as `regex`.
+
+    Builders are immutable, so the common chain heads (`regex.digits`,
+    `regex.then("-")`, ...) are built once and shared; after the first
+    access they are plain instance-dict hits.
+    """
+
+    @functools.cached_property
+    def digit(self) -> RegexBuilder:
+        return super().digit
+
+    @functools.cached_property
+    def word(self) -> RegexBuilder:
+        return super().word
+
+    @functools.cached_property
+    def whitespace(self) -> RegexBuilder:
+        return super().whitespace
+
+    @functools.cached_property
+    def any_char(self) -> RegexBuilder:
+        return super().any_char
+
+    @functools.cached_property
+    def letter(self) -> RegexBuilder:
+        return super().letter
+
+    @functools.cached_property
+    def digits(self) -> RegexBuilder:
+        return super().digits
+
+    @functools.cached_property
+    def words(self) -> RegexBuilder:
+        return super().words
+
+    @functools.cached_property
+    def whitespaces(self) -> RegexBuilder:
+        return super().whitespaces
+
+    @functools.cached_property
+    def any_chars(self) -> RegexBuilder:
+        return super().any_chars
+
+    @functools.cached_property
+    def letters(self) -> RegexBuilder:
+        return super().letters
+
+    def then(self, text: str) -> RegexBuilder:
+        return _root_then(text)
+
+
+@functools.lru_cache(maxsize=256)
+def _root_then(text: str) -> RegexBuilder:
+    # The root adds no components, so its then() heads need no parent.
+    return RegexBuilder((Literal(text),))
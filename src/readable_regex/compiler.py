@@ -1,9 +1,19 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
-from readable_regex.components import Component
+if TYPE_CHECKING:
+    from readable_regex.components import Component
 
 
 def compile_components(components: Sequence[Component]) -> str:
-    return "".join(c.compile() for c in components)
+    # Most patterns are a handful of components; skip the join for the
+    # smallest (and most common) cases.
+    n = len(components)
+    if n == 0:
+        return ""
+    if n == 1:
+        return components[0].compile()
+    if n == 2:
+        return components[0].compile() + components[1].compile()
+    return "".join([c.compile() for c in components])
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
-import re
+import functools
 from enum import Enum
-from typing import Protocol, Sequence
+from typing import Final, Protocol, Sequence
+
+from readable_regex.compiler import compile_components
+
+# Same character set `re.escape` uses (stable since Python 3.7); calling
+# str.translate directly skips re.escape's per-call type dispatch.
+SPECIAL_CHARS: Final = frozenset("()[]{}?*+-|^$\\.&~# \t\n\r\v\f")
+ESCAPE_TABLE: Final = {ord(ch): "\\" + ch for ch in SPECIAL_CHARS}
+
+
+def _escape(text: str) -> str:
+    # Most literals are plain words; a set check lets them skip the
+    # translate call and its output copy.
+    if SPECIAL_CHARS.isdisjoint(text):
+        return text
+    return text.translate(ESCAPE_TABLE)
 
 
 class Component(Protocol):
@@ -10,11 +25,22 @@ class Component(Protocol):
 
 
 class Literal:
-    def __init__(self, text: str) -> None:
+    __slots__ = ("_atomic", "_compiled", "split_at", "text")
+
+    def __init__(self, text: str, split_at: int = 0, escaped: str | None = None) -> None:
         self.text = text
+        # When adjacent literals are merged, the offset where the most
+        # recently added text starts; a quantifier only applies to that part.
+        self.split_at = split_at
+        # Escaping is per character, so merged literals pass in the
+        # concatenation of their already-escaped parts.
+        self._compiled = _escape(text) if escaped is None else escaped
+        # A single character, even when escaped (e.g. `\-`), takes a
+        # quantifier directly without a (?:...) wrapper.
+        self._atomic = len(text) == 1
 
     def compile(self) -> str:
-        return re.escape(self.text)
+        return self._compiled
 
 
 class AnchorType(Enum):
@@ -23,11 +49,40 @@ class AnchorType(Enum):
 
 
 class Anchor:
+    __slots__ = ("_compiled", "anchor_type")
+    _atomic = False
+
     def __init__(self, anchor_type: AnchorType) -> None:
         self.anchor_type = anchor_type
+        self._compiled = anchor_type.value
+
+    def compile(self) -> str:
+        return self._compiled
+
+
+class AnchoredLiteral:
+    """Literal text fused with the `^` before it or the `$` after it."""
+
+    __slots__ = ("_compiled", "anchor_type", "literal")
+    _atomic = False
+
+    def __init__(self, anchor_type: AnchorType, literal: Literal) -> None:
+        self.anchor_type = anchor_type
+        self.literal = literal
+        if anchor_type is AnchorType.START:
+            self._compiled = anchor_type.value + literal.compile()
+        else:
+            self._compiled = literal.compile() + anchor_type.value
 
     def compile(self) -> str:
-        return self.anchor_type.value
+        return self._compiled
+
+    def split(self) -> tuple[Component, Component]:
+        """The equivalent separate anchor and literal, in pattern order."""
+        anchor = Anchor(self.anchor_type)
+        if self.anchor_type is AnchorType.START:
+            return anchor, self.literal
+        return self.literal, anchor
 
 
 class CharClassType(Enum):
@@ -38,7 +93,7 @@ class CharClassType(Enum):
     LETTER = "[a-zA-Z]"
 
 
-NEGATED_MAP = {
+NEGATED_MAP: Final = {
     CharClassType.DIGIT: r"\D",
     CharClassType.WORD: r"\W",
     CharClassType.WHITESPACE: r"\S",
@@ -48,42 +103,87 @@ NEGATED_MAP = {
 
 
 class CharClass:
+    __slots__ = ("_compiled", "class_type")
+    _atomic = True
+
     def __init__(self, class_type: CharClassType) -> None:
         self.class_type = class_type
+        self._compiled = class_type.value
 
     def compile(self) -> str:
-        return self.class_type.value
+        return self._compiled
 
 
 class NegatedCharClass:
+    __slots__ = ("_compiled", "class_type")
+    _atomic = True
+
     def __init__(self, class_type: CharClassType) -> None:
         self.class_type = class_type
+        self._compiled = NEGATED_MAP[class_type]
 
     def compile(self) -> str:
-        return NEGATED_MAP[self.class_type]
+        return self._compiled
+
+
+def _class_body(chars: str) -> str:
+    """Escape the characters of a `[...]` class, writing runs of four or
+    more consecutive digits or ASCII letters as ranges (`abcdef` → `a-f`).
+    """
+    if len(chars) < 4:
+        return _escape(chars)
+    codes = sorted({ord(ch) for ch in chars if ch.isascii() and ch.isalnum()})
+    ranges = []
+    covered: set[str] = set()
+    i = 0
+    while i < len(codes):
+        j = i
+        while j + 1 < len(codes) and codes[j + 1] == codes[j] + 1:
+            j += 1
+        # Digits and the two letter cases are separated by punctuation in
+        # ASCII, so a run never spans more than one of them.
+        if j - i >= 3:
+            ranges.append(f"{chr(codes[i])}-{chr(codes[j])}")
+            covered.update(map(chr, range(codes[i], codes[j] + 1)))
+        i = j + 1
+    if not ranges:
+        return _escape(chars)
+    rest = "".join(ch for ch in chars if ch not in covered)
+    return "".join(ranges) + _escape(rest)
 
 
 class AnyOf:
+    __slots__ = ("_compiled", "items")
+    _atomic = True
+
     def __init__(self, items: Sequence[str]) -> None:
         self.items = list(items)
+        if all(len(item) == 1 for item in self.items):
+            # Escape the joined characters in one pass rather than one call
+            # per item.
+            self._compiled = f"[{_class_body(''.join(self.items))}]"
+        else:
+            escaped_items = [_escape(item) for item in self.items]
+            self._compiled = f"(?:{'|'.join(escaped_items)})"
 
     def compile(self) -> str:
-        if all(len(item) == 1 for item in self.items):
-            escaped = "".join(re.escape(ch) for ch in self.items)
-            return f"[{escaped}]"
-        escaped_items = [re.escape(item) for item in self.items]
-        return f"(?:{'|'.join(escaped_items)})"
+        return self._compiled
 
 
 class Group:
-    def __init__(self, content: Sequence[Component]) -> None:
-        self.content = list(content)
+    __slots__ = ("_compiled", "content")
+    _atomic = True
 
-    def compile(self) -> str:
-        from readable_regex.compiler import compile_components
+    def __init__(self, content: Sequence[Component], inner: str | None = None) -> None:
+        self.content = tuple(content)
+        # `inner` lets callers that already hold the content's pattern
+        # (e.g. a builder's cached .pattern) skip recompiling it.
+        if inner is None:
+            inner = compile_components(self.content)
+        self._compiled = f"({inner})"
 
-        inner = compile_components(self.content)
-        return f"({inner})"
+    def compile(self) -> str:
+        return self._compiled
 
 
 class QuantifierKind(Enum):
@@ -94,7 +194,18 @@ class QuantifierKind(Enum):
     RANGE = "range"
 
 
+# Preformatted brace suffixes for the counts patterns use most; anything
+# else is formatted on demand.
+_EXACT_SUFFIXES: Final[dict[int, str]] = {n: f"{{{n}}}" for n in range(1, 17)}
+_RANGE_SUFFIXES: Final[dict[tuple[int, int], str]] = {
+    (lo, hi): f"{{{lo},{hi}}}" for lo in range(5) for hi in range(lo + 1, 9)
+}
+
+
 class Quantifier:
+    __slots__ = ("_compiled", "count", "kind", "max_count", "min_count", "target")
+    _atomic = False
+
     def __init__(
         self,
         target: Component,
@@ -108,46 +219,81 @@ class Quantifier:
         self.count = count
         self.min_count = min_count
         self.max_count = max_count
+        self._compiled: str | None = None
 
     def compile(self) -> str:
+        if self._compiled is None:
+            self._compiled = self._build()
+        return self._compiled
+
+    def _build(self) -> str:
         inner = self.target.compile()
-        needs_wrap = (
-            len(inner) > 1
-            and not isinstance(self.target, (CharClass, NegatedCharClass, Group))
-            and not (inner.startswith("(") and inner.endswith(")"))
-            and not (inner.startswith("[") and inner.endswith("]"))
-        )
-        if needs_wrap:
-            inner = f"(?:{inner})"
+        # Components tag themselves as atomic when their compiled form can
+        # take a quantifier directly; untagged components fall back to
+        # inspecting the compiled string.
+        if len(inner) > 1 and not getattr(self.target, "_atomic", False):
+            first, last = inner[0], inner[-1]
+            if not ((first == "(" and last == ")") or (first == "[" and last == "]")):
+                inner = f"(?:{inner})"
 
         if self.kind == QuantifierKind.EXACT:
-            return f"{inner}{{{self.count}}}"
+            count = self.count
+            suffix = _EXACT_SUFFIXES.get(count) if count is not None else None
+            return inner + (suffix or f"{{{count}}}")
         elif self.kind == QuantifierKind.RANGE:
-            return f"{inner}{{{self.min_count},{self.max_count}}}"
+            lo, hi = self.min_count, self.max_count
+            suffix = None
+            if lo is not None and hi is not None:
+                suffix = _RANGE_SUFFIXES.get((lo, hi))
+            return inner + (suffix or f"{{{lo},{hi}}}")
         else:
             return f"{inner}{self.kind.value}"
 
 
+# Character classes carry no per-use state, so the builder shares one
+# instance per class type (plain and one-or-more, normal and negated).
+CHAR_CLASSES: Final = {t: CharClass(t) for t in CharClassType}
+NEGATED_CHAR_CLASSES: Final = {t: NegatedCharClass(t) for t in CharClassType}
+CHAR_CLASSES_PLUS: Final = {
+    t: Quantifier(CHAR_CLASSES[t], QuantifierKind.ONE_OR_MORE) for t in CharClassType
+}
+NEGATED_CHAR_CLASSES_PLUS: Final = {
+    t: Quantifier(NEGATED_CHAR_CLASSES[t], QuantifierKind.ONE_OR_MORE) for t in CharClassType
+}
+
+
 class ExcludeFilter:
     """Represents a character class with certain characters excluded."""
 
+    __slots__ = ("_compiled", "base", "excluded_chars")
+    _atomic = True
+
     def __init__(self, base: CharClassType, excluded_chars: str) -> None:
         self.base = base
         self.excluded_chars = excluded_chars
 
-    def compile(self) -> str:
         # Build a negated character class that excludes both the negation
         # of the base class and the excluded characters.
         # e.g., \w excluding '_' → [^\W_]
-        negated_base = NEGATED_MAP[self.base]
-        escaped_excluded = re.escape(self.excluded_chars)
+        negated_base = NEGATED_MAP[base]
+        escaped_excluded = _escape(excluded_chars)
 
         # If negated base is a simple escape like \W, use it directly in bracket
         if negated_base.startswith("\\"):
-            return f"[^{negated_base}{escaped_excluded}]"
+            self._compiled = f"[^{negated_base}{escaped_excluded}]"
         # If it's a bracket expression like [^a-zA-Z], extract the inner part
-        if negated_base.startswith("[^") and negated_base.endswith("]"):
+        elif negated_base.startswith("[^") and negated_base.endswith("]"):
             inner = negated_base[2:-1]
-            return f"[^{inner}{escaped_excluded}]"
+            self._compiled = f"[^{inner}{escaped_excluded}]"
         # Fallback
-        return f"[^{negated_base}{escaped_excluded}]"
+        else:
+            self._compiled = f"[^{negated_base}{escaped_excluded}]"
+
+    def compile(self) -> str:
+        return self._compiled
+
+
+@functools.lru_cache(maxsize=256)
+def exclude_filter(base: CharClassType, excluded_chars: str) -> ExcludeFilter:
+    """Shared ExcludeFilter per (base, excluded_chars), built once."""
+    return ExcludeFilter(base, excluded_chars)
@@ -3,10 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from readable_regex.components import (
+    NEGATED_CHAR_CLASSES,
+    NEGATED_CHAR_CLASSES_PLUS,
     CharClassType,
-    NegatedCharClass,
-    Quantifier,
-    QuantifierKind,
 )
 
 if TYPE_CHECKING:
@@ -20,54 +19,51 @@ class ExcludeProxy:
     negated character classes (e.g., `\\D`, `\\W`).
     """
 
+    __slots__ = ("_builder",)
+
     def __init__(self, builder: RegexBuilder) -> None:
         self._builder = builder
 
-    def _add(self, class_type: CharClassType) -> RegexBuilder:
-        return self._builder._extend(NegatedCharClass(class_type))
-
-    def _add_plus(self, class_type: CharClassType) -> RegexBuilder:
-        target = NegatedCharClass(class_type)
-        return self._builder._extend(Quantifier(target, QuantifierKind.ONE_OR_MORE))
-
     # Singular (one)
     @property
     def digit(self) -> RegexBuilder:
-        return self._add(CharClassType.DIGIT)
+        return self._builder._extend(NEGATED_CHAR_CLASSES[CharClassType.DIGIT])
 
     @property
     def word(self) -> RegexBuilder:
-        return self._add(CharClassType.WORD)
+        return self._builder._extend(NEGATED_CHAR_CLASSES[CharClassType.WORD])
 
     @property
     def whitespace(self) -> RegexBuilder:
-        return self._add(CharClassType.WHITESPACE)
+        return self._builder._extend(NEGATED_CHAR_CLASSES[CharClassType.WHITESPACE])
 
     @property
     def letter(self) -> RegexBuilder:
-        return self._add(CharClassType.LETTER)
+        return self._builder._extend(NEGATED_CHAR_CLASSES[CharClassType.LETTER])
 
     @property
     def any_char(self) -> RegexBuilder:
-        return self._add(CharClassType.ANY)
+        return self._builder._extend(NEGATED_CHAR_CLASSES[CharClassType.ANY])
 
     # Plural (one or more)
     @property
     def digits(self) -> RegexBuilder:
-        return self._add_plus(CharClassType.DIGIT)
+        return self._builder._extend(NEGATED_CHAR_CLASSES_PLUS[CharClassType.DIGIT])
 
     @property
     def words(self) -> RegexBuilder:
-        return self._add_plus(CharClassType.WORD)
+        return self._builder._extend(NEGATED_CHAR_CLASSES_PLUS[CharClassType.WORD])
 
     @property
     def whitespaces(self) -> RegexBuilder:
-        return self._add_plus(CharClassType.WHITESPACE)
+        return self._builder._extend(
+            NEGATED_CHAR_CLASSES_PLUS[CharClassType.WHITESPACE]
+        )
 
     @property
     def letters(self) -> RegexBuilder:
-        return self._add_plus(CharClassType.LETTER)
+        return self._builder._extend(NEGATED_CHAR_CLASSES_PLUS[CharClassType.LETTER])
 
     @property
     def any_chars(self) -> RegexBuilder:
-        return self._add_plus(CharClassType.ANY)
+        return self._builder._extend(NEGATED_CHAR_CLASSES_PLUS[CharClassType.ANY])
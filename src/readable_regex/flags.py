@@ -1,20 +1,15 @@
 from __future__ import annotations
 
 import re
-from enum import Enum
+from enum import IntFlag
 
 
-class Flag(Enum):
-    IGNORE_CASE = "IGNORECASE"
-    MULTILINE = "MULTILINE"
+class Flag(IntFlag):
+    """Builder flags, valued as the matching `re` flag bits.
 
+    Builders store flags as a plain int bitmask that is passed straight to
+    the regex engine.
+    """
 
-def flags_to_re(flags: frozenset[Flag]) -> re.RegexFlag:
-    mapping = {
-        Flag.IGNORE_CASE: re.IGNORECASE,
-        Flag.MULTILINE: re.MULTILINE,
-    }
-    result = re.RegexFlag(0)
-    for flag in flags:
-        result |= mapping[flag]
-    return result
+    IGNORE_CASE = re.IGNORECASE
+    MULTILINE = re.MULTILINE
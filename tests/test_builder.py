@@ -1,5 +1,11 @@
+import re
+
 import pytest
+from readable_regex import builder as builder_module
+from readable_regex import components as components_module
+from readable_regex import regex
 from readable_regex.builder import RegexBuilder
+from readable_regex.components import CharClassType, exclude_filter
 
 
 def rb() -> RegexBuilder:
@@ -25,6 +31,31 @@ class TestAnchorsAndLiterals:
     def test_then_escapes(self):
         assert rb().then("a.b").pattern == r"a\.b"
 
+    def test_adjacent_literals_merge(self):
+        p = rb().then("a").then(".").then("c")
+        assert p.pattern == r"a\.c"
+        assert p.optional.pattern == r"a\.c?"
+
+    def test_merged_literal_escaping(self):
+        text = "a.b(c)[d]{e}*+?^$|\\ -#&~"
+        p = rb()
+        for ch in text:
+            p = p.then(ch)
+        assert p.pattern == re.escape(text)
+
+    def test_anchored_text_then_more(self):
+        assert rb().starts_with("Hi").then("!").ends_with().pattern == r"^Hi!$"
+
+    def test_quantify_anchored_text(self):
+        assert rb().starts_with("ab").then("c").optional.pattern == "^abc?"
+        assert rb().starts_with("ab").optional.pattern == "^(?:ab)?"
+        assert rb().ends_with("x").one_or_more.pattern == "x$+"
+
+    def test_quantifier_applies_to_last_then(self):
+        assert rb().then("colour").then("s").optional.pattern == "colours?"
+        assert rb().then("ab").then("cd").one_or_more.pattern == "ab(?:cd)+"
+        assert rb().then("a").then("b").then("cd").exactly(2).pattern == "ab(?:cd){2}"
+
 
 class TestSingularItems:
     def test_digit(self):
@@ -76,6 +107,22 @@ class TestCapture:
         inner = rb().digits.then("-").digits
         assert rb().capture(inner).pattern == r"(\d+\-\d+)"
 
+    def test_capture_reuses_content_pattern(self, monkeypatch):
+        inner = rb().digits.then("-").digits
+        pattern = inner.pattern
+
+        def fail(components):
+            raise AssertionError("content recompiled")
+
+        monkeypatch.setattr(components_module, "compile_components", fail)
+        assert rb().capture(inner).pattern == f"({pattern})"
+
+
+class TestSharedComponents:
+    def test_quantifying_shared_class_leaves_it_intact(self):
+        assert rb().digit.exactly(2).pattern == r"\d{2}"
+        assert rb().digit.pattern == r"\d"
+
 
 class TestQuantifiers:
     def test_exactly(self):
@@ -93,6 +140,12 @@ class TestQuantifiers:
     def test_one_or_more(self):
         assert rb().digit.one_or_more.pattern == r"\d+"
 
+    def test_single_atoms_are_not_grouped(self):
+        assert rb().then(".").optional.pattern == r"\.?"
+        assert rb().then("x").then("-").zero_or_more.pattern == r"x\-*"
+        assert rb().any_of("a", "b").one_or_more.pattern == "[ab]+"
+        assert rb().then("ab").zero_or_more.pattern == "(?:ab)*"
+
     def test_quantifier_no_component_raises(self):
         with pytest.raises(ValueError):
             rb().exactly(3)
@@ -123,6 +176,10 @@ class TestExclude:
     def test_excluding_chars_from_singular(self):
         assert rb().word.excluding("_").pattern == r"[^\W_]"
 
+    def test_excluding_reuses_filter(self):
+        assert exclude_filter(CharClassType.WORD, "_") is exclude_filter(CharClassType.WORD, "_")
+        assert rb().digit.then(" ").words.excluding("_").pattern == r"\d\ [^\W_]+"
+
     def test_excluding_on_non_charclass_raises(self):
         with pytest.raises(ValueError):
             rb().then("hello").excluding("_")
@@ -152,10 +209,67 @@ class TestImmutability:
         ci = base.ignore_case
         ml = base.multiline
         assert ci._flags != ml._flags
-        assert len(base._flags) == 0
+        assert base._flags == 0
+
+    def test_no_instance_dict(self):
+        assert not hasattr(rb().digit, "__dict__")
+
+    def test_flags_are_re_bits(self):
+        flags = rb().then("x").ignore_case.multiline.ignore_case.compile().flags
+        assert flags & (re.IGNORECASE | re.MULTILINE) == re.IGNORECASE | re.MULTILINE
+
+
+class TestEquality:
+    def test_equal_when_pattern_and_flags_match(self):
+        assert rb().digit.exactly(3) == rb().digit.exactly(3)
+        assert hash(rb().then("a").then("b")) == hash(rb().then("ab"))
+        assert rb().then("x") != rb().then("x").ignore_case
+        assert rb().digit != r"\d"
+
+    def test_usable_as_key(self):
+        cache = {rb().words: "words"}
+        assert cache[rb().words] == "words"
 
 
 class TestPatternProperty:
     def test_shows_raw_regex(self):
         p = rb().starts_with("Hello").whitespace.words.ends_with()
         assert p.pattern == r"^Hello\s\w+$"
+
+    def test_pattern_cached(self):
+        p = rb().digits.then("-").words
+        assert p.pattern is p.pattern
+
+    def test_extends_compiled_parent_pattern(self, monkeypatch):
+        base = rb().starts_with("id").digits
+        assert base.pattern == r"^id\d+"
+        compiled = []
+        real = builder_module.compile_components
+
+        def counting(components):
+            compiled.append(len(components))
+            return real(components)
+
+        monkeypatch.setattr(builder_module, "compile_components", counting)
+        assert base.then("-").pattern == r"^id\d+\-"
+        assert compiled == [1]
+
+    def test_long_chain(self):
+        p = rb()
+        for _ in range(5000):
+            p = p.digit
+        assert p.pattern == r"\d" * 5000
+
+
+class TestRoot:
+    def test_heads_are_shared(self):
+        assert regex.digits is regex.digits
+        assert regex.then("-") is regex.then("-")
+        assert type(regex.letter) is RegexBuilder
+
+    def test_shared_heads_stay_immutable(self):
+        head = regex.digit
+        assert head.exactly(3).pattern == r"\d{3}"
+        assert regex.digit.pattern == r"\d"
+        assert regex.then("a").then("b").pattern == "ab"
+        assert regex.then("a").pattern == "a"
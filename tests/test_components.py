@@ -1,5 +1,11 @@
+import re
+
+import pytest
+
+from readable_regex.compiler import compile_components
 from readable_regex.components import (
     Anchor,
+    AnchoredLiteral,
     AnchorType,
     AnyOf,
     CharClass,
@@ -24,6 +30,14 @@ class TestLiteral:
     def test_empty_string(self):
         assert Literal("").compile() == ""
 
+    def test_matches_re_escape(self):
+        text = "".join(chr(i) for i in range(0x300))
+        assert Literal(text).compile() == re.escape(text)
+
+    def test_each_char_matches_re_escape(self):
+        for i in range(0x80):
+            assert Literal(chr(i)).compile() == re.escape(chr(i))
+
 
 class TestAnchor:
     def test_start(self):
@@ -33,6 +47,18 @@ class TestAnchor:
         assert Anchor(AnchorType.END).compile() == "$"
 
 
+class TestAnchoredLiteral:
+    def test_start(self):
+        assert AnchoredLiteral(AnchorType.START, Literal("a.b")).compile() == r"^a\.b"
+
+    def test_end(self):
+        assert AnchoredLiteral(AnchorType.END, Literal("bye")).compile() == "bye$"
+
+    def test_split(self):
+        anchor, literal = AnchoredLiteral(AnchorType.START, Literal("x")).split()
+        assert (anchor.compile(), literal.compile()) == ("^", "x")
+
+
 class TestCharClass:
     def test_digit(self):
         assert CharClass(CharClassType.DIGIT).compile() == r"\d"
@@ -77,6 +103,18 @@ class TestAnyOf:
     def test_escapes_special_chars(self):
         assert AnyOf([".", "-"]).compile() == r"[\.\-]"
 
+    def test_collapses_runs_to_ranges(self):
+        assert AnyOf(list("abcdef0123456789")).compile() == "[0-9a-f]"
+        assert AnyOf(list("xabcd-")).compile() == r"[a-dx\-]"
+        assert AnyOf(list("9ABCDZ")).compile() == "[A-D9Z]"
+
+    def test_ranges_match_same_chars(self):
+        items = list("qabcd-XYZW789.")
+        listed = re.compile("[" + re.escape("".join(items)) + "]")
+        ranged = re.compile(AnyOf(items).compile())
+        for i in range(0x80):
+            assert bool(ranged.match(chr(i))) == bool(listed.match(chr(i)))
+
 
 class TestGroup:
     def test_wraps_content(self):
@@ -103,15 +141,32 @@ class TestQuantifier:
     def test_range(self):
         assert Quantifier(CharClass(CharClassType.DIGIT), QuantifierKind.RANGE, min_count=1, max_count=3).compile() == r"\d{1,3}"
 
+    def test_uncommon_counts(self):
+        assert Quantifier(CharClass(CharClassType.DIGIT), QuantifierKind.EXACT, count=42).compile() == r"\d{42}"
+        assert Quantifier(CharClass(CharClassType.DIGIT), QuantifierKind.RANGE, min_count=7, max_count=20).compile() == r"\d{7,20}"
+        assert Quantifier(CharClass(CharClassType.DIGIT), QuantifierKind.EXACT, count=0).compile() == r"\d{0}"
+
     def test_wraps_literal(self):
         assert Quantifier(Literal("abc"), QuantifierKind.ONE_OR_MORE).compile() == "(?:abc)+"
 
     def test_single_char_literal_no_wrap(self):
         assert Quantifier(Literal("a"), QuantifierKind.ONE_OR_MORE).compile() == "a+"
 
+    def test_escaped_single_char_literal_no_wrap(self):
+        assert Quantifier(Literal("-"), QuantifierKind.EXACT, count=3).compile() == r"\-{3}"
+        assert Quantifier(Literal("."), QuantifierKind.RANGE, min_count=1, max_count=2).compile() == r"\.{1,2}"
+
     def test_no_double_wrap_group(self):
         assert Quantifier(Group([Literal("x")]), QuantifierKind.OPTIONAL).compile() == "(x)?"
 
+    def test_no_wrap_atomic_components(self):
+        assert Quantifier(AnyOf(["ab", "cd"]), QuantifierKind.OPTIONAL).compile() == "(?:ab|cd)?"
+        assert Quantifier(ExcludeFilter(CharClassType.WORD, "_"), QuantifierKind.ONE_OR_MORE).compile() == r"[^\W_]+"
+
+    def test_wraps_quantifier(self):
+        inner = Quantifier(CharClass(CharClassType.DIGIT), QuantifierKind.ONE_OR_MORE)
+        assert Quantifier(inner, QuantifierKind.OPTIONAL).compile() == r"(?:\d+)?"
+
 
 class TestExcludeFilter:
     def test_word_excluding_underscore(self):
@@ -121,3 +176,28 @@ class TestExcludeFilter:
     def test_letter_excluding_chars(self):
         result = ExcludeFilter(CharClassType.LETTER, "x").compile()
         assert result == r"[^a-zA-Zx]"
+
+
+class TestCompileCaching:
+    def test_repeat_compile_is_cached(self):
+        q = Quantifier(Literal("abc"), QuantifierKind.ONE_OR_MORE)
+        assert q.compile() is q.compile()
+
+    def test_slots_prevent_new_attributes(self):
+        with pytest.raises(AttributeError):
+            Literal("a").extra = 1
+
+
+class TestCompileComponents:
+    def test_empty(self):
+        assert compile_components(()) == ""
+
+    def test_one(self):
+        assert compile_components([Literal("a")]) == "a"
+
+    def test_two(self):
+        assert compile_components([Literal("a"), CharClass(CharClassType.DIGIT)]) == r"a\d"
+
+    def test_many(self):
+        parts = [Literal("a"), CharClass(CharClassType.DIGIT), Literal("."), Anchor(AnchorType.END)]
+        assert compile_components(parts) == r"a\d\.$"
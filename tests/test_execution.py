@@ -1,4 +1,12 @@
-from readable_regex import regex
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import readable_regex
+from readable_regex import builder as builder_module
+from readable_regex import precompile, purge, regex
 
 
 class TestSearch:
@@ -33,6 +41,15 @@ class TestReplace:
         result = regex.digits.replace("a1b2c3", "#")
         assert result == "a#b#c#"
 
+    def test_repl_supports_backrefs(self):
+        swap = regex.capture(regex.words).then("=").capture(regex.words)
+        assert swap.replace("a=b, c=d", r"\2=\1") == "b=a, d=c"
+
+    def test_repl_is_not_the_subject(self):
+        # Pattern.sub takes (repl, text); re.sub takes (pattern, repl, text).
+        assert regex.then("x").replace("xyx", "Z") == "ZyZ"
+        assert regex.then("x").replace("Z", "xyx") == "Z"
+
 
 class TestSplit:
     def test_split_on_whitespace(self):
@@ -50,9 +67,67 @@ class TestTest:
 
 class TestCompile:
     def test_returns_pattern(self):
-        import re
         assert isinstance(regex.digit.compile(), re.Pattern)
 
     def test_cached(self):
         builder = regex.digit
         assert builder.compile() is builder.compile()
+
+    def test_execution_methods_compile_once(self, monkeypatch):
+        calls = []
+        real = builder_module._compile_cached
+
+        def counting(pattern, flags):
+            calls.append(pattern)
+            return real(pattern, flags)
+
+        monkeypatch.setattr(builder_module, "_compile_cached", counting)
+        b = regex.capture(regex.digits).then("-").digits
+        for _ in range(3):
+            b.test("1-2")
+            b.search("1-2")
+            b.match("1-2")
+            b.find_all("1-2 3-4")
+            b.replace("1-2", "x")
+            b.split("a1-2b")
+        assert calls == [r"(\d+)\-\d+"]
+
+    def test_shared_across_builders(self):
+        assert regex.digits.compile() is regex.digits.compile()
+
+    def test_cache_keyed_by_flags(self):
+        plain = regex.then("cache-key").compile()
+        assert regex.then("cache-key").ignore_case.compile() is not plain
+        assert regex.then("cache-key").compile() is plain
+
+    def test_purge(self):
+        regex.then("purge-me").compile()
+        purge()
+        assert builder_module._compile_cached.cache_info().currsize == 0
+
+
+class TestPrewarm:
+    def test_prewarm_returns_builder(self, monkeypatch):
+        builder = regex.digits.then("-")
+        assert builder.prewarm() is builder
+        monkeypatch.setattr(builder_module, "_compile_cached", None)
+        assert builder.test("12-") is True
+        assert builder.search("a12-").group() == "12-"
+
+    def test_precompile(self):
+        patterns = precompile({"num": regex.digits, "word": regex.words.ignore_case})
+        assert patterns["num"].pattern == r"\d+"
+        assert patterns["word"].flags & re.IGNORECASE
+
+
+class TestImport:
+    def test_numba_loaded_lazily(self):
+        src = str(Path(readable_regex.__file__).parents[1])
+        code = (
+            "import sys; from readable_regex import precompile, regex; "
+            "precompile({'phone': regex.digit.exactly(3).then('-').digit.exactly(4)}); "
+            "sys.exit('numba' in sys.modules)"
+        )
+        env = {**os.environ, "PYTHONPATH": src}
+        result = subprocess.run([sys.executable, "-c", code], env=env, check=False)
+        assert result.returncode == 0
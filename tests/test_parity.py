@@ -6,21 +6,34 @@ to equivalent raw `re` patterns across a wide range of complexity.
 import re
 
 import pytest
+from readable_regex import builder as builder_module
 from readable_regex import regex
+from readable_regex._scanners import scan, scan_spec
+from readable_regex.builder import RegexBuilder
+from readable_regex.components import (
+    CharClass,
+    CharClassType,
+    Literal,
+    Quantifier,
+    QuantifierKind,
+)
 
 
 # ── Helpers ─────────────────────────────────────────────────────────
+#
+# Each helper prewarms the builder (idempotent) so the parity checks also
+# run against the fast paths prepared ahead of first use.
 
 def assert_same_findall(readable, raw_pattern, text, flags=0):
     """Assert find_all results match re.findall results."""
     raw = re.compile(raw_pattern, flags)
-    assert readable.find_all(text) == raw.findall(text)
+    assert readable.prewarm().find_all(text) == raw.findall(text)
 
 
 def assert_same_search(readable, raw_pattern, text, flags=0):
     """Assert both find (or don't find) a match, and the match value is the same."""
     raw = re.compile(raw_pattern, flags)
-    r_match = readable.search(text)
+    r_match = readable.prewarm().search(text)
     raw_match = raw.search(text)
     if raw_match is None:
         assert r_match is None
@@ -32,19 +45,19 @@ def assert_same_search(readable, raw_pattern, text, flags=0):
 def assert_same_sub(readable, raw_pattern, text, repl, flags=0):
     """Assert replace results match re.sub results."""
     raw = re.compile(raw_pattern, flags)
-    assert readable.replace(text, repl) == raw.sub(repl, text)
+    assert readable.prewarm().replace(text, repl) == raw.sub(repl, text)
 
 
 def assert_same_split(readable, raw_pattern, text, flags=0):
     """Assert split results match re.split results."""
     raw = re.compile(raw_pattern, flags)
-    assert readable.split(text) == raw.split(text)
+    assert readable.prewarm().split(text) == raw.split(text)
 
 
 def assert_same_match_bool(readable, raw_pattern, text, flags=0):
     """Assert test() matches whether re.search finds anything."""
     raw = re.compile(raw_pattern, flags)
-    assert readable.test(text) == (raw.search(text) is not None)
+    assert readable.prewarm().test(text) == (raw.search(text) is not None)
 
 
 # ── Simple patterns ─────────────────────────────────────────────────
@@ -124,6 +137,93 @@ class TestAnchorParity:
             assert_same_match_bool(r, r"^\d+$", text)
 
 
+class TestLiteralTestParity:
+    """Literal-only patterns are tested with str methods instead of `re`."""
+
+    TEXTS = ("abc", "abc\n", "xabc", "abcx", "x\nabc", "ab", "", "\n")
+
+    def test_unanchored(self):
+        for text in self.TEXTS:
+            assert_same_match_bool(regex.then("abc"), r"abc", text)
+
+    def test_starts_with(self):
+        for text in self.TEXTS:
+            assert_same_match_bool(regex.starts_with("abc"), r"^abc", text)
+
+    def test_ends_with(self):
+        for text in self.TEXTS:
+            assert_same_match_bool(regex.ends_with("abc"), r"abc$", text)
+
+    def test_fully_anchored(self):
+        r = regex.starts_with("a").then("bc").ends_with()
+        for text in self.TEXTS:
+            assert_same_match_bool(r, r"^abc$", text)
+
+    def test_bare_anchors(self):
+        for text in self.TEXTS:
+            assert_same_match_bool(regex.starts_with().ends_with(), r"^$", text)
+
+    def test_multiline_anchors(self):
+        r = regex.ends_with("abc").multiline
+        for text in self.TEXTS:
+            assert_same_match_bool(r, r"abc$", text, re.MULTILINE)
+
+
+class TestRequiredLiteralParity:
+    """test() rejects text missing a required literal before running `re`."""
+
+    def test_prefiltered_test(self):
+        r = regex.then("http").then("s").optional.then("://").words
+        for text in ["http://example", "https://secure", "ftp://other", "http:/x", ""]:
+            assert_same_match_bool(r, r"https?://\w+", text)
+
+    def test_quantified_empty_text(self):
+        # then("").optional compiles to a bare `?` on the preceding character.
+        r = regex.then("a").then("").optional
+        for text in ["", "a", "b"]:
+            assert_same_match_bool(r, "a?", text)
+        r = regex.then("(").optional.then("$").then("").zero_or_more.then("[")
+        for text in ["[", "($[", "$$[", "x"]:
+            assert_same_match_bool(r, r"\(?\$*\[", text)
+        assert r.find_all("[") == ["["]
+
+    def test_multiline(self):
+        r = regex.starts_with("# ").words.multiline
+        for text in ["x\n# todo", "#todo", "a # b"]:
+            assert_same_match_bool(r, r"^\# \w+", text, re.MULTILINE)
+
+
+class TestPlainLiteralParity:
+    """find_all/replace/split on plain text run on str methods, not `re`."""
+
+    TEXTS = ("foo bar foo baz", "foofoofoo", "fo o", "", "a.b.c")
+
+    def test_find_all(self):
+        for raw, r in [("foo", regex.then("foo")), (r"\.", regex.then("."))]:
+            for text in self.TEXTS:
+                assert_same_findall(r, raw, text)
+
+    def test_replace(self):
+        r = regex.then("foo")
+        for repl in ["qux", "", r"[\g<0>]", r"a\tb"]:
+            for text in self.TEXTS:
+                assert_same_sub(r, "foo", text, repl)
+
+    def test_replace_callable(self):
+        assert regex.then("o").replace("foo", lambda m: m.group().upper()) == "fOO"
+
+    def test_split(self):
+        r = regex.then("o").then("o")
+        for text in self.TEXTS:
+            assert_same_split(r, "oo", text)
+
+    def test_ignore_case_uses_re(self):
+        r = regex.then("foo").ignore_case
+        assert_same_findall(r, "foo", "Foo FOO foo", re.IGNORECASE)
+        assert_same_split(r, "foo", "aFOOb", re.IGNORECASE)
+        assert_same_sub(r, "foo", "aFOOb", "x", re.IGNORECASE)
+
+
 # ── Quantifier patterns ─────────────────────────────────────────────
 
 class TestQuantifierParity:
@@ -147,6 +247,12 @@ class TestQuantifierParity:
         for text in ["gal", "goal", "goooal", "gool"]:
             assert_same_search(r, r"goo*al", text)
 
+    def test_quantified_escaped_char(self):
+        r = regex.then("=").then("-").between(2, 4).then(">")
+        assert r.pattern == r"=\-{2,4}>"
+        for text in ["=->", "=-->", "=---->", "=----->", "x"]:
+            assert_same_search(r, r"=-{2,4}>", text)
+
 
 # ── Alternation ──────────────────────────────────────────────────────
 
@@ -166,6 +272,12 @@ class TestAlternationParity:
         text = "a-b.c_d e"
         assert_same_findall(r, r"[\-\._]", text)
 
+    def test_any_of_bracket_special_chars(self):
+        r = regex.any_of("]", "^", "\\", "-", "[")
+        assert r.pattern.startswith("[")
+        text = "a]b^c\\d-e[f"
+        assert_same_findall(r, r"[\]\^\\\-\[]", text)
+
 
 # ── Capture group patterns ───────────────────────────────────────────
 
@@ -182,6 +294,12 @@ class TestCaptureParity:
         text = "key=value foo=bar x=1"
         assert r.find_all(text) == raw.findall(text)
 
+    def test_multiple_groups_long_text(self):
+        r = regex.capture(regex.digit.exactly(3)).then("-").capture(regex.digit.exactly(4))
+        raw = re.compile(r"(\d{3})-(\d{4})")
+        text = "call 555-1234 or 555-9876 now; " * 50
+        assert r.find_all(text) == raw.findall(text)
+
     def test_group_search(self):
         r = regex.capture(regex.digits).then("-").capture(regex.digits)
         raw = re.compile(r"(\d+)-(\d+)")
@@ -266,6 +384,58 @@ class TestMediumParity:
             assert_same_match_bool(r, raw, text, re.IGNORECASE)
 
 
+class TestDigitScannerParity:
+    """Fixed-width digit patterns may be scanned without `re` on long text."""
+
+    TEXT = ("ph 555-123-4567, 12-345-6789 or 5551234567 / 1234-567-8901-234 " * 20).strip()
+
+    DIGIT = CharClass(CharClassType.DIGIT)
+
+    def exactly(self, n):
+        return Quantifier(self.DIGIT, QuantifierKind.EXACT, n)
+
+    def test_scan_spec(self):
+        phone = [self.exactly(3), Literal("-"), self.exactly(4)]
+        assert scan_spec(phone) == (-1, -1, -1, 45, -1, -1, -1, -1)
+        assert scan_spec([Quantifier(self.DIGIT, QuantifierKind.ONE_OR_MORE)]) is None
+        assert scan_spec([Literal("-")]) is None
+
+    def test_scan_matches_findall(self):
+        for components in [
+            (self.exactly(3), Literal("-"), self.exactly(3), Literal("-"), self.exactly(4)),
+            (self.exactly(2),),
+            (Literal("5"), self.DIGIT),
+        ]:
+            builder = RegexBuilder(components)
+            raw = re.compile(builder.pattern)
+            spec = scan_spec(components)
+            buf = self.TEXT.encode("ascii")
+            out = [0] * len(buf)
+            found = scan(buf, spec, out)
+            assert [self.TEXT[i : i + len(spec)] for i in out[:found]] == raw.findall(self.TEXT)
+            assert_same_findall(builder, builder.pattern, self.TEXT)
+
+    def test_scanner_built_on_first_find_all(self, monkeypatch):
+        built = []
+        real = builder_module.make_scanner
+
+        def counting(spec):
+            built.append(spec)
+            return real(spec)
+
+        monkeypatch.setattr(builder_module, "make_scanner", counting)
+        r = regex.digit.exactly(3).then("-").digit.exactly(4)
+        assert built == []
+        for _ in range(2):
+            assert r.find_all(self.TEXT) == re.findall(r"\d{3}-\d{4}", self.TEXT)
+        assert len(built) == 1
+
+    def test_non_ascii_text(self):
+        r = regex.digit.exactly(2)
+        text = "\u0661\u0662 12 " * 100
+        assert_same_findall(r, r"\d{2}", text)
+
+
 # ── Replace parity ──────────────────────────────────────────────────
 
 class TestReplaceParity: